@@ -1,10 +1,12 @@
 """
 Alert Configuration UI Module
 """
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
 from config_manager import ConfigManager
+from ui_utils import configure_styles_once
 
 class AlertConfigUI:
     """UI for configuring alert settings"""
@@ -16,6 +18,8 @@ class AlertConfigUI:
         self.service_email = tk.StringVar()
         self.service_whatsapp = tk.StringVar()
         self.service_whatsapp_groups = tk.StringVar()
+        self._iid_to_config = {}  # Treeview item id -> service config
+        self._feedback_after = None  # Pending after() id that clears the feedback label
         
         # Create a new toplevel window
         self.window = tk.Toplevel(parent)
@@ -49,7 +53,11 @@ class AlertConfigUI:
         self._setup_styles()
         
         # Initialize configuration manager
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager(scheduler=self.window)
+        
+        # Closing only hides the window so it can be shown again without
+        # rebuilding it; pending config writes are flushed first
+        self.window.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Create status bar at the bottom of the window
         status_frame = ttk.Frame(self.window, relief=tk.SUNKEN, borderwidth=1)
@@ -68,21 +76,8 @@ class AlertConfigUI:
     
     def _setup_styles(self):
         """Setup all styles for the UI"""
+        configure_styles_once(self.window)
         style = ttk.Style(self.window)
-        style.theme_use('clam')
-        
-        # Basic styles
-        style.configure('TFrame', background='#F0F0F0')
-        style.configure('TButton', padding=6)
-        style.configure('TLabel', background='#F0F0F0', foreground='#000000')
-        style.configure('TLabelframe', background='#F0F0F0')
-        style.configure('TLabelframe.Label', background='#F0F0F0', foreground='#000000', font=('Segoe UI', 9, 'bold'))
-        style.configure('TSeparator', background='#C0C0C0')
-        style.configure('TNotebook', background='#F0F0F0')
-        style.configure('TNotebook.Tab', padding=[10, 4], font=('Segoe UI', 9), background='#E1E1E1')
-        style.configure('TEntry', fieldbackground='white', foreground='black')
-        style.configure('TCombobox', fieldbackground='white', foreground='black')
-        style.map('TNotebook.Tab', background=[('selected', '#F0F0F0'), ('active', '#E5E5E5')])
         
         # Custom styles
         style.configure('Header.TLabel', font=('Segoe UI', 12, 'bold'), background='#F0F0F0', foreground='#000000')
@@ -92,12 +87,6 @@ class AlertConfigUI:
         style.configure('Error.TLabel', foreground='#CC0000', background='#F0F0F0')
         style.configure('Add.TButton', font=('Segoe UI', 9, 'bold'))
         style.configure('Delete.TButton', font=('Segoe UI', 9, 'bold'), foreground='white', background='red')  # Custom style for delete button
-        
-        # Make sure all child widgets inherit these styles
-        self.window.option_add("*TCombobox*Listbox*Background", 'white')
-        self.window.option_add("*TCombobox*Listbox*Foreground", 'black')
-        self.window.option_add("*Background", '#F0F0F0')
-        self.window.option_add("*Foreground", 'black')
     
     def _create_ui(self):
         """Create the main UI components"""
@@ -178,36 +167,51 @@ class AlertConfigUI:
         """Handle selection in the service treeview"""
         selected = self.tree.selection()
         if selected:
-            # Get the actual service name from the first column value instead of the 'text' property
-            service_name = self.tree.item(selected, 'values')[0]
+            # Item ids are the service names
+            service_name = selected[0]
             print(f"Selected service: {service_name}")  # Debug print
             
-            # Check if service exists in config before loading
-            if service_name in self.config_manager.config['services']:
-                self.load_service(service_name)
+            # Use the config remembered for this row instead of looking it up again
+            service_config = self._iid_to_config.get(service_name)
+            if service_config is not None:
+                self.load_service(service_name, service_config)
                 self.delete_button.pack(side=tk.BOTTOM, padx=5, pady=5)  # Show the delete button
             else:
                 print(f"Warning: Selected service '{service_name}' not found in configuration")
 
     def _populate_services(self):
         """Populate the service list treeview with services from the configuration"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing items in a single call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._iid_to_config = {}
 
         # Add services to Treeview with their details
         for service_name, service_config in self.config_manager.config['services'].items():
-            # Check if the item already exists
-            if not self.tree.exists(service_name):
-                # Insert the item with service_name as both the identifier and the first column value
-                self.tree.insert('', 'end', iid=service_name, text=service_name, values=(
-                    service_name,  # First column is service name
-                    ','.join(service_config.get('email', [])),
-                    ','.join(service_config.get('whatsapp', [])),
-                    ','.join(service_config.get('whatsapp_groups', [])),
-                    service_config.get('period', 0),
-                    service_config.get('number_of_alerts', 0)
-                ))
+            # Insert the item with service_name as both the identifier and the first column value
+            self.tree.insert('', 'end', iid=service_name, text=service_name,
+                             values=self._row_values(service_name, service_config))
+            self._iid_to_config[service_name] = service_config
+
+    def _row_values(self, service_name, service_config):
+        """Build the Treeview column values for a service"""
+        return (
+            service_name,  # First column is service name
+            *self.config_manager.get_service_csv(service_name),
+            service_config['period'],
+            service_config['number_of_alerts']
+        )
+
+    def _upsert_service_row(self, service_name, index='end'):
+        """Update the Treeview row of a service, inserting it if it is not listed yet"""
+        service_config = self.config_manager.config['services'][service_name]
+        values = self._row_values(service_name, service_config)
+        if self.tree.exists(service_name):
+            self.tree.item(service_name, values=values)
+        else:
+            self.tree.insert('', index, iid=service_name, text=service_name, values=values)
+        self._iid_to_config[service_name] = service_config
 
     def add_new_service(self):
         """Prepare UI for adding a new service"""
@@ -216,11 +220,11 @@ class AlertConfigUI:
         self.show_service_form()
         self.status_label.configure(text="Adding new service")
     
-    def load_service(self, service_name):
+    def load_service(self, service_name, service_config):
         """Load a service configuration into the details panel"""
         self.is_new_service = False
         self.current_service = service_name
-        self.show_service_form()
+        self.show_service_form(service_config)
         self.status_label.configure(text=f"Editing service: {service_name}")
     
     def load_default_config(self):
@@ -232,6 +236,12 @@ class AlertConfigUI:
     
     def show_default_form(self):
         """Show form for default configuration in the bottom section."""
+        # Read the current defaults once
+        defaults = self.config_manager.config['default_config']
+        emails_csv = ','.join(defaults['email'])
+        whatsapp_csv = ','.join(defaults['whatsapp'])
+        groups_csv = ','.join(defaults['whatsapp_groups'])
+
         # 1) Clear whatever was in details_frame
         for widget in self.details_frame.winfo_children():
             widget.destroy()
@@ -269,8 +279,7 @@ class AlertConfigUI:
         self.default_email.pack(fill=tk.X, pady=(0, 5))
 
         # Insert existing default emails from config
-        default_emails = self.config_manager.config['default_config'].get('email', [])
-        self.default_email.insert(0, ','.join(default_emails))
+        self.default_email.insert(0, emails_csv)
 
         ttk.Label(
             email_inner,
@@ -293,8 +302,7 @@ class AlertConfigUI:
         self.default_whatsapp = ttk.Entry(whatsapp_inner, width=60)
         self.default_whatsapp.pack(fill=tk.X, pady=(0, 5))
 
-        default_whatsapp_nums = self.config_manager.config['default_config'].get('whatsapp', [])
-        self.default_whatsapp.insert(0, ','.join(default_whatsapp_nums))
+        self.default_whatsapp.insert(0, whatsapp_csv)
 
         ttk.Label(
             whatsapp_inner,
@@ -308,8 +316,7 @@ class AlertConfigUI:
         self.default_whatsapp_groups = ttk.Entry(whatsapp_inner, width=60)
         self.default_whatsapp_groups.pack(fill=tk.X, pady=(0, 5))
 
-        default_whatsapp_grps = self.config_manager.config['default_config'].get('whatsapp_groups', [])
-        self.default_whatsapp_groups.insert(0, ','.join(default_whatsapp_grps))
+        self.default_whatsapp_groups.insert(0, groups_csv)
 
         ttk.Label(
             whatsapp_inner,
@@ -342,11 +349,16 @@ class AlertConfigUI:
         )
         cancel_btn.pack(side=tk.RIGHT, padx=5)
 
+    @staticmethod
+    def _parse_csv(text):
+        """Split a comma-separated entry into a list of non-empty, stripped values"""
+        return [token for token in (part.strip() for part in text.split(',')) if token]
+
     def save_default_config(self):
         # Gather fields
-        emails = [e.strip() for e in self.default_email.get().split(',') if e.strip()]
-        whatsapp_nums = [w.strip() for w in self.default_whatsapp.get().split(',') if w.strip()]
-        whatsapp_grps = [g.strip() for g in self.default_whatsapp_groups.get().split(',') if g.strip()]
+        emails = self._parse_csv(self.default_email.get())
+        whatsapp_nums = self._parse_csv(self.default_whatsapp.get())
+        whatsapp_grps = self._parse_csv(self.default_whatsapp_groups.get())
 
         # Update config
         self.config_manager.config['default_config']['email'] = emails
@@ -357,88 +369,97 @@ class AlertConfigUI:
         self.config_manager.save_config()
 
         # Feedback
-        if hasattr(self, 'feedback_label') and self.feedback_label.winfo_exists():
-            self.feedback_label.configure(text="Default configuration saved successfully!", style='Success.TLabel')
-            self.status_label.configure(text="Default configuration saved")
-        
-        # Clear feedback after 3 seconds
-        self.details_frame.after(3000, lambda: self.feedback_label.configure(text="") if hasattr(self, 'feedback_label') and self.feedback_label.winfo_exists() else None)
+        self._flash_feedback("Default configuration saved successfully!")
+        self.status_label.configure(text="Default configuration saved")
     
     def save_service(self):
         # Get the new service name
-        new_name = self.service_name_var.get().strip()
+        new_name = sys.intern(self.service_name_var.get().strip())
         if not new_name:
             # Display an error message if service name is empty
             messagebox.showerror("Error", "Service name cannot be empty", parent=self.window)
             return
 
-        # If this is a new service, ensure old_name is not None
-        if self.is_new_service:
-            old_name = None
-        else:
-            old_name = self.current_service
-
-        # If old_name exists, copy its config to the new name
-        if old_name and old_name in self.config_manager.config['services']:
-            self.config_manager.config['services'][new_name] = self.config_manager.config['services'][old_name]
-            if old_name != new_name:
-                del self.config_manager.config['services'][old_name]
-        else:
-            # Create a new service entry
-            self.config_manager.config['services'][new_name] = {
-                'email': [],
-                'whatsapp': [],
-                'whatsapp_groups': [],
-                'period': 0,
-                'number_of_alerts': 0
-            }
-
-        # Now update the email/WhatsApp fields
-        email_list = [e.strip() for e in self.service_email.get().split(',') if e.strip()]
-        whatsapp_list = [w.strip() for w in self.service_whatsapp.get().split(',') if w.strip()]
-        whatsapp_groups_list = [g.strip() for g in self.service_whatsapp_groups.get().split(',') if g.strip()]
-        
-        # Get period value with error handling
+        # Validate the numeric fields before touching the configuration so a
+        # bad value does not leave a half-saved service behind
         try:
             period_str = self.period_entry.get().strip()
             period = int(period_str) if period_str else 0
-        except ValueError:
-            period = 0
-            messagebox.showwarning("Warning", "Invalid period value. Using default value 0.", parent=self.window)
-
-        # Get number of alerts with error handling
-        try:
             number_of_alerts_str = self.number_of_alerts_entry.get().strip()
             number_of_alerts = int(number_of_alerts_str) if number_of_alerts_str else 0
         except ValueError:
-            number_of_alerts = 0
-            messagebox.showwarning("Warning", "Invalid number of alerts. Using default value 0.", parent=self.window)
+            self._flash_feedback(
+                "Alert period and number of alerts must be whole numbers",
+                'Error.TLabel'
+            )
+            return
+
+        # Now gather the email/WhatsApp fields
+        email_list = self._parse_csv(self.service_email.get())
+        whatsapp_list = self._parse_csv(self.service_whatsapp.get())
+        whatsapp_groups_list = self._parse_csv(self.service_whatsapp_groups.get())
+
+        # If this is a new service, ensure old_name is not None
+        if self.is_new_service:
+            old_name = None
+        else:
+            old_name = self.current_service
 
-        # Update the configuration
-        self.config_manager.config['services'][new_name].update({
+        # Take the existing entry out (a rename never has both keys present)
+        # or start a new one, then store it under the new name
+        services = self.config_manager.config['services']
+        service_config = services.pop(old_name, None) if old_name else None
+        if service_config is None:
+            service_config = {}
+        service_config.update({
             'email': email_list,
             'whatsapp': whatsapp_list,
             'whatsapp_groups': whatsapp_groups_list,
             'period': period,
             'number_of_alerts': number_of_alerts
         })
+        services[new_name] = service_config
 
         # Save the updated config
         self.config_manager.save_config()
 
         # Show success feedback
-        if hasattr(self, 'feedback_label') and self.feedback_label.winfo_exists():
-            self.feedback_label.configure(
-                text=f"Service '{new_name}' saved successfully!",
-                style='Success.TLabel'
-            )
-            self.status_label.configure(text=f"Service '{new_name}' saved")
-
-            # Clear the feedback after a few seconds
-            self.details_frame.after(3000, lambda: self.feedback_label.configure(text="") if hasattr(self, 'feedback_label') and self.feedback_label.winfo_exists() else None)
-
-        # Re-populate the service list to reflect the new name
-        self._populate_services()
+        self._flash_feedback(f"Service '{new_name}' saved successfully!")
+        self.status_label.configure(text=f"Service '{new_name}' saved")
+
+        # Update only the affected row; a renamed service keeps its position
+        index = 'end'
+        if old_name and old_name != new_name and self.tree.exists(old_name):
+            index = self.tree.index(old_name)
+            self.tree.delete(old_name)
+            self._iid_to_config.pop(old_name, None)
+        self._upsert_service_row(new_name, index)
+        
+        # Further saves from this form now apply to the saved service
+        self.is_new_service = False
+        self.current_service = new_name
+
+    def _flash_feedback(self, msg, style='Success.TLabel'):
+        """
+        Show a feedback message and clear it after 3 seconds
+        
+        Any clear still pending from an earlier save is cancelled first so
+        quick repeated saves keep a single timer.
+        
+        Args:
+            msg (str): Message to display
+            style (str): ttk style for the feedback label
+        """
+        if self._feedback_after:
+            self.details_frame.after_cancel(self._feedback_after)
+        self.feedback_label.configure(text=msg, style=style)
+        self._feedback_after = self.details_frame.after(3000, self._clear_feedback)
+
+    def _clear_feedback(self):
+        """Clear the feedback label if the form that owns it is still shown"""
+        self._feedback_after = None
+        if self.feedback_label.winfo_exists():
+            self.feedback_label.configure(text="")
 
     def delete_service(self):
         """Delete the current service"""
@@ -461,7 +482,9 @@ class AlertConfigUI:
         # Update UI
         self.current_service = None
         self.is_new_service = False
-        self._populate_services()
+        if self.tree.exists(service_name):
+            self.tree.delete(service_name)
+        self._iid_to_config.pop(service_name, None)
         self.show_empty_details()
         
         # Show feedback
@@ -469,12 +492,29 @@ class AlertConfigUI:
     
     def save_configuration(self):
         """Save all configuration changes and close window"""
-        self.config_manager.save_config()
+        self.config_manager.flush()
         self.status_label.configure(text="Configuration saved successfully")
-        self.window.destroy()
+        self.window.withdraw()
+
+    def _on_close(self):
+        """Write pending configuration changes and hide the window"""
+        self.config_manager.flush()
+        self.window.withdraw()
+
+    def show(self):
+        """Show the window again, reloading the service list only if the config file changed"""
+        if self.config_manager.reload_if_changed():
+            self._populate_services()
+            self.show_empty_details()
+            self.delete_button.pack_forget()
+        self.window.deiconify()
+        self.window.lift()
+
+    def show_service_form(self, service_config=None):
+        """Show form for adding a new service or editing an existing one (non-default)."""
+        if service_config is None:
+            service_config = {}
 
-    def show_service_form(self):
-        """Show form for editing an existing service (non-default)."""
         # 1) Clear the details_frame
         for widget in self.details_frame.winfo_children():
             widget.destroy()
@@ -490,10 +530,7 @@ class AlertConfigUI:
             style='Header.TLabel'
         ).pack(anchor=tk.W, pady=(0, 20))
 
-        # 3) Retrieve the existing config
-        service_config = self.config_manager.config['services'].get(self.current_service, {})
-
-        # 4) Create text fields for email, WhatsApp, etc.
+        # 3) Create text fields for email, WhatsApp, etc.
         # Service Name field
         ttk.Label(form_container, text="Service Name:").pack(anchor=tk.W, pady=(0, 5))
         self.service_name_var.set(self.current_service or "")
@@ -534,7 +571,7 @@ class AlertConfigUI:
         self.number_of_alerts_entry.pack(fill=tk.X, pady=(0, 5))
         self.number_of_alerts_entry.insert(0, str(service_config.get('number_of_alerts', 0)))  # Default value
 
-        # 5) Create a Save button that calls save_service()
+        # 4) Create a Save button that calls save_service()
         button_frame = ttk.Frame(form_container)
         button_frame.pack(fill=tk.X, pady=(20, 0))
 
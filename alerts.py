@@ -1,15 +1,43 @@
 """
 Alert sending functionality for the service monitor
 """
+import atexit
 import os
-import smtplib
-import pywhatkit
+import socket
+import threading
+import time
 import csv
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from pathlib import Path
 
+# Timestamp format used in alert messages and the CSV log
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# A connection used this recently is trusted without a NOOP round trip; if
+# it did drop, _send_message reconnects and retries once
+_SMTP_IDLE_CHECK = 30
+
+# Both modules are only needed once an alert goes out; pywhatkit in
+# particular pulls in PyAutoGUI and a browser driver on import
+_pywhatkit = None
+_smtplib = None
+
+def _get_pywhatkit():
+    """Import pywhatkit on first use and cache the module"""
+    global _pywhatkit
+    if _pywhatkit is None:
+        import pywhatkit as _pywhatkit
+    return _pywhatkit
+
+def _get_smtplib():
+    """Import smtplib on first use and cache the module"""
+    global _smtplib
+    if _smtplib is None:
+        import smtplib as _smtplib
+    return _smtplib
+
 class AlertManager:
     """Manages sending alerts when services are down"""
     
@@ -19,58 +47,86 @@ class AlertManager:
         self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
         self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
         
+        # WhatsApp Cloud API credentials; without them messages to numbers
+        # fall back to pywhatkit's browser automation
+        self.whatsapp_token = os.getenv('WHATSAPP_TOKEN')
+        self.whatsapp_phone_id = os.getenv('WHATSAPP_PHONE_ID')
+        self._whatsapp_session = None
+        
         # Create logs directory if it doesn't exist
         self.logs_dir = Path('service_logs')
         self.logs_dir.mkdir(exist_ok=True)
+        
+        # Keep today's CSV log open for the lifetime of the manager; rows are
+        # buffered and written together by flush_log()
+        self._csv_f = None
+        self._csv_writer = None
+        self._csv_date = None
+        self._csv_lock = threading.Lock()
+        self._pending_rows = []
+        self._open_csv()
+        atexit.register(self.close)
+        
+        # SMTP session is opened on first use and reused across alerts
+        self._smtp = None
+        self._smtp_last_used = 0.0
+    
+    def close(self):
+        """Write buffered log rows, then close the CSV log and the SMTP connection"""
+        self.flush_log()
+        with self._csv_lock:
+            self._close_csv()
+        self._close_smtp()
     
-    def send_whatsapp_alert(self, service_name, config):
+    def send_whatsapp_alert(self, service_name, config, timestamp=None):
         """
         Send WhatsApp alert for a specific service
         
         Args:
             service_name (str): Name of the service
             config (dict): Service configuration
+            timestamp (str): Preformatted alert time, defaults to now
             
         Returns:
             bool: True if alert was sent successfully
         """
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
         message = f"🔴 ALERT: Service Down - {service_name}\n"
-        message += f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        message += f"Time: {timestamp}"
 
-        current_time = datetime.now()
-        send_time = current_time.replace(minute=current_time.minute + 2)
         alert_sent = False
         recipients = []
+        use_cloud_api = bool(self.whatsapp_token and self.whatsapp_phone_id)
 
         # Send to individual numbers
         for number in config.get("whatsapp", []):
             if not number.strip():
                 continue
             try:
-                pywhatkit.sendwhatmsg(
-                    number.strip(),
-                    message,
-                    send_time.hour,
-                    send_time.minute,
-                    wait_time=15,
-                    tab_close=True
-                )
+                if use_cloud_api:
+                    self._send_whatsapp_cloud(number.strip(), message)
+                else:
+                    _get_pywhatkit().sendwhatmsg_instantly(
+                        number.strip(),
+                        message,
+                        wait_time=5,
+                        tab_close=True
+                    )
                 print(f"WhatsApp alert sent to {number} for service {service_name}")
                 alert_sent = True
                 recipients.append(number)
             except Exception as e:
                 print(f"Failed to send WhatsApp alert to {number}: {str(e)}")
 
-        # Send to group chats
+        # Send to group chats; the Cloud API cannot post to groups, so these
+        # always go through pywhatkit
         for group_link in config.get("whatsapp_groups", []):
             try:
                 group_id = group_link.split('/')[-1]
-                pywhatkit.sendwhatmsg_to_group(
+                _get_pywhatkit().sendwhatmsg_to_group_instantly(
                     group_id,
                     message,
-                    send_time.hour,
-                    send_time.minute,
-                    wait_time=15,
+                    wait_time=5,
                     tab_close=True
                 )
                 print(f"WhatsApp alert sent to group {group_id} for service {service_name}")
@@ -85,18 +141,45 @@ class AlertManager:
             "DOWN",
             alert_sent,
             "WhatsApp",
-            recipients
+            recipients,
+            timestamp
         )
         
         return alert_sent
 
-    def send_email_alert(self, service_name, config):
+    def _send_whatsapp_cloud(self, number, message):
+        """
+        Send a text message through the WhatsApp Cloud API
+        
+        Args:
+            number (str): Recipient phone number in international format
+            message (str): Message body
+        """
+        if self._whatsapp_session is None:
+            import requests
+            self._whatsapp_session = requests.Session()
+            self._whatsapp_session.headers['Authorization'] = f"Bearer {self.whatsapp_token}"
+            
+        response = self._whatsapp_session.post(
+            f"https://graph.facebook.com/v19.0/{self.whatsapp_phone_id}/messages",
+            json={
+                'messaging_product': 'whatsapp',
+                'to': number.lstrip('+'),
+                'type': 'text',
+                'text': {'body': message}
+            },
+            timeout=5
+        )
+        response.raise_for_status()
+
+    def send_email_alert(self, service_name, config, timestamp=None):
         """
         Send email alert for a specific service
         
         Args:
             service_name (str): Name of the service
             config (dict): Service configuration
+            timestamp (str): Preformatted alert time, defaults to now
             
         Returns:
             bool: True if alert was sent successfully
@@ -110,23 +193,21 @@ class AlertManager:
             print("No email recipients configured")
             return False
             
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
         msg = MIMEMultipart()
         msg['From'] = self.email_sender
         msg['To'] = ', '.join(recipients)
-        msg['Subject'] = f"ALERT: Service Down - {service_name} - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        msg['Subject'] = f"ALERT: Service Down - {service_name} - {timestamp}"
 
         body = f"The service {service_name} is currently DOWN.\n"
-        body += f"\nTime: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+        body += f"\nTime: {timestamp}"
         msg.attach(MIMEText(body, 'plain'))
 
         alert_sent = False
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_sender, self.email_password)
-                server.send_message(msg)
-                print(f"Email alert sent successfully for service {service_name}")
-                alert_sent = True
+            self._send_message(msg)
+            print(f"Email alert sent successfully for service {service_name}")
+            alert_sent = True
         except Exception as e:
             print(f"Failed to send email alert: {str(e)}")
 
@@ -136,30 +217,170 @@ class AlertManager:
             "DOWN",
             alert_sent,
             "Email",
-            recipients
+            recipients,
+            timestamp
         )
         
         return alert_sent
         
+    def send_batch_email_alert(self, services, timestamp=None):
+        """
+        Send one email per recipient list covering every down service
+        
+        Services that share the same email recipients are reported together
+        in a single message instead of one message per service.
+        
+        Args:
+            services (list): List of (service_name, config) tuples
+            timestamp (str): Preformatted alert time, defaults to now
+            
+        Returns:
+            dict: Mapping of service name to whether its alert was sent
+        """
+        results = {service_name: False for service_name, _ in services}
+        if not self.email_sender or not self.email_password:
+            print("Email credentials not configured")
+            return results
+
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
+        
+        # Group services by their recipient list
+        groups = {}
+        for service_name, config in services:
+            recipients = tuple(config.get("email", []))
+            if not recipients:
+                print(f"No email recipients configured for service {service_name}")
+                continue
+            groups.setdefault(recipients, []).append(service_name)
+
+        for recipients, service_names in groups.items():
+            if len(service_names) == 1:
+                results[service_names[0]] = self.send_email_alert(
+                    service_names[0], {"email": list(recipients)}, timestamp
+                )
+                continue
+
+            msg = MIMEMultipart()
+            msg['From'] = self.email_sender
+            msg['To'] = ', '.join(recipients)
+            msg['Subject'] = f"ALERT: {len(service_names)} Services Down - {timestamp}"
+
+            body = "The following services are currently DOWN:\n"
+            body += ''.join(f"  - {service_name}\n" for service_name in service_names)
+            body += f"\nTime: {timestamp}"
+            msg.attach(MIMEText(body, 'plain'))
+
+            alert_sent = False
+            try:
+                self._send_message(msg)
+                print(f"Email alert sent successfully for services {', '.join(service_names)}")
+                alert_sent = True
+            except Exception as e:
+                print(f"Failed to send email alert: {str(e)}")
+
+            # Log email alert status for each service in the message
+            for service_name in service_names:
+                results[service_name] = alert_sent
+                self.log_service_status(
+                    service_name,
+                    "DOWN",
+                    alert_sent,
+                    "Email",
+                    list(recipients),
+                    timestamp
+                )
+
+        return results
+
+    def _ensure_smtp(self):
+        """
+        Return an authenticated SMTP connection, reconnecting if it went stale
+        
+        Returns:
+            smtplib.SMTP: Live SMTP connection
+        """
+        smtplib = _get_smtplib()
+        if self._smtp is not None:
+            if time.monotonic() - self._smtp_last_used < _SMTP_IDLE_CHECK:
+                return self._smtp
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._close_smtp()
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            # Let the OS probe the idle connection between outages so a
+            # silently dropped session is detected without a failed send
+            server.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            server.starttls()
+            server.login(self.email_sender, self.email_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _close_smtp(self):
+        """Close the persistent SMTP connection if it is open"""
+        if self._smtp is not None:
+            smtplib = _get_smtplib()
+            try:
+                self._smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self._smtp.close()
+            self._smtp = None
+
+    def _send_message(self, msg):
+        """Send a message over the persistent SMTP connection, reconnecting once if dropped"""
+        try:
+            self._ensure_smtp().send_message(msg)
+        except _get_smtplib().SMTPServerDisconnected:
+            self._close_smtp()
+            self._ensure_smtp().send_message(msg)
+        self._smtp_last_used = time.monotonic()
+        
     def _get_csv_filename(self):
         """Generate CSV filename based on current date"""
         return self.logs_dir / f"{datetime.now().strftime('%y_%m_%d')}.csv"
 
-    def _ensure_csv_headers(self, filename):
-        """Ensure CSV file exists with proper headers"""
-        if not filename.exists():
-            with open(filename, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Timestamp',
-                    'Service Name',
-                    'Status',
-                    'Alert Sent',
-                    'Alert Type',
-                    'Recipients'
-                ])
-
-    def log_service_status(self, service_name, status, alert_sent=False, alert_type=None, recipients=None):
+    def _open_csv(self):
+        """Open today's CSV log in append mode, writing headers if the file is new"""
+        csv_file = self._get_csv_filename()
+        is_new = not csv_file.exists()
+        
+        self._csv_f = open(csv_file, 'a', newline='')
+        self._csv_writer = csv.writer(self._csv_f)
+        self._csv_date = datetime.now().date()
+        
+        if is_new:
+            self._csv_writer.writerow([
+                'Timestamp',
+                'Service Name',
+                'Status',
+                'Alert Sent',
+                'Alert Type',
+                'Recipients'
+            ])
+            self._csv_f.flush()
+
+    def _close_csv(self):
+        """Close the CSV log handle if it is open"""
+        if self._csv_f is not None:
+            self._csv_f.close()
+            self._csv_f = None
+            self._csv_writer = None
+
+    def _rotate_if_new_day(self):
+        """Switch to a new CSV log file when the date changes, or reopen it after close()"""
+        if self._csv_f is None or datetime.now().date() != self._csv_date:
+            self._close_csv()
+            self._open_csv()
+
+    def log_service_status(self, service_name, status, alert_sent=False, alert_type=None, recipients=None,
+                           timestamp=None):
         """
         Log service status to daily CSV file
         
@@ -169,21 +390,30 @@ class AlertManager:
             alert_sent (bool): Whether alert was sent
             alert_type (str): Type of alert sent
             recipients (list): List of alert recipients
+            timestamp (str): Preformatted event time, defaults to now
         """
-        csv_file = self._get_csv_filename()
-        self._ensure_csv_headers(csv_file)
-
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = timestamp or datetime.now().strftime(TIMESTAMP_FORMAT)
         
-        with open(csv_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
+        # Alerts are logged from the alert thread while UP statuses are
+        # logged from the OCR thread, so serialize access to the buffer
+        with self._csv_lock:
+            self._pending_rows.append((
                 timestamp,
                 service_name,
                 status,
                 alert_sent,
                 alert_type or '',
                 ', '.join(recipients) if recipients else ''
-            ])
+            ))
             
-        print(f"Logged {status} status for {service_name}")
\ No newline at end of file
+        print(f"Logged {status} status for {service_name}")
+    
+    def flush_log(self):
+        """Write all buffered log rows to today's CSV file in one call"""
+        with self._csv_lock:
+            if not self._pending_rows:
+                return
+            self._rotate_if_new_day()
+            self._csv_writer.writerows(self._pending_rows)
+            self._csv_f.flush()
+            self._pending_rows.clear()
\ No newline at end of file
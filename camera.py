@@ -2,36 +2,85 @@
 Camera handling functions for service monitoring
 """
 import cv2
-import re
+import platform
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Number of camera indexes checked when listing cameras
+_PROBE_INDEXES = 10
+
+
+def _probe_camera(index, backend):
+    """
+    Check whether a camera index opens and delivers a frame
+    
+    Args:
+        index (int): Camera index to probe
+        backend (int): OpenCV capture backend
+        
+    Returns:
+        tuple: (index, True if the camera delivered a frame)
+    """
+    cap = cv2.VideoCapture(index, backend)
+    try:
+        return index, cap.isOpened() and cap.read()[0]
+    finally:
+        cap.release()
+
 
 class CameraManager:
     """Manages camera operations for the monitoring system"""
     
     def __init__(self):
         self.camera = None
+        
+        # Background capture thread keeps grabbing frames so the newest one
+        # is always ready; frames are handed over through a single-slot queue
+        self.capture_thread = None
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._frame_requested = threading.Event()
+        self._stop_capture = threading.Event()
+        
+        # Result of the last camera probe, reused until a refresh is forced
+        self._camera_cache = None
     
-    def list_cameras(self):
+    def list_cameras(self, force=False):
         """
         List all available cameras and their working status
         
+        Probing opens every device, so the result is cached and only
+        re-probed when force is True (the Refresh button).
+        
+        Args:
+            force (bool): Probe the devices again even if a cached list exists
+            
         Returns:
             list: List of tuples (camera_id, camera_name)
         """
-        available_cameras = []
-        for i in range(10):  # Check first 10 indexes
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                ret, frame = cap.read()
-                if ret:
-                    camera_name = f"Camera {i}"
-                    try:
-                        # Try to get camera name (works on some systems)
-                        cap.set(cv2.CAP_PROP_SETTINGS, 1)
-                    except:
-                        pass
-                    available_cameras.append((i, camera_name))
-                cap.release()
-        return available_cameras
+        if self._camera_cache is not None and not force:
+            return list(self._camera_cache)
+            
+        # Skip OpenCV's backend autodetection on Linux, which tries several
+        # backends in turn for every index
+        system = platform.system()
+        backend = cv2.CAP_V4L2 if system == 'Linux' else cv2.CAP_ANY
+        
+        if system == 'Darwin':
+            # AVFoundation asks for camera permission on the main thread and
+            # fails to open devices from other threads, so probe in order
+            results = [_probe_camera(i, backend) for i in range(_PROBE_INDEXES)]
+            available_cameras = [(i, f"Camera {i}") for i, ok in results if ok]
+        else:
+            # Opening a device is I/O bound and OpenCV releases the GIL while it
+            # waits, so probe all indexes at once instead of one after another
+            with ThreadPoolExecutor(max_workers=_PROBE_INDEXES) as executor:
+                results = executor.map(lambda i: _probe_camera(i, backend), range(_PROBE_INDEXES))
+                available_cameras = [(i, f"Camera {i}") for i, ok in results if ok]
+            
+        self._camera_cache = available_cameras
+        return list(available_cameras)
     
     def initialize_camera(self, camera_id_or_string):
         """
@@ -43,17 +92,14 @@ class CameraManager:
         Returns:
             bool: True if camera was initialized successfully
         """
-        # If passed a string like "Camera 0 (ID: 0)", extract the ID
+        # If passed a string like "Camera 0 (ID: 0)", extract the ID; a bare
+        # number has no "ID: " part and is parsed as is
         if isinstance(camera_id_or_string, str):
-            match = re.search(r'ID: (\d+)', camera_id_or_string)
-            if match:
-                camera_id = int(match.group(1))
-            else:
-                try:
-                    camera_id = int(camera_id_or_string)
-                except ValueError:
-                    print(f"Invalid camera identifier: {camera_id_or_string}")
-                    return False
+            try:
+                camera_id = int(camera_id_or_string.rpartition('ID: ')[2].rstrip(') '))
+            except ValueError:
+                print(f"Invalid camera identifier: {camera_id_or_string}")
+                return False
         else:
             camera_id = camera_id_or_string
         
@@ -63,7 +109,6 @@ class CameraManager:
         # Initialize new camera
         try:
             # Check if we're on macOS to handle Continuity Camera properly
-            import platform
             if platform.system() == 'Darwin':  # macOS
                 # On macOS, we need to use AVFoundation backend
                 self.camera = cv2.VideoCapture(camera_id, cv2.CAP_AVFOUNDATION)
@@ -84,31 +129,98 @@ class CameraManager:
             if not self.camera.isOpened():
                 print(f"Failed to open camera {camera_id}")
                 return False
+                
+            # Keep only one frame queued in the driver so a retrieved frame
+            # is never several frames behind the screen
+            self.camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+            
+            self._start_capture_thread()
             return True
         except Exception as e:
             print(f"Error initializing camera {camera_id}: {str(e)}")
             return False
     
-    def capture_frame(self):
+    def _start_capture_thread(self):
+        """Start the background thread that continuously grabs frames"""
+        self._stop_capture.clear()
+        self._frame_requested.clear()
+        self.capture_thread = threading.Thread(
+            target=self._capture_loop,
+            name="camera-capture",
+            daemon=True
+        )
+        self.capture_thread.start()
+    
+    def _capture_loop(self):
+        """Grab frames continuously and decode one only when a frame is requested"""
+        camera = self.camera
+        while not self._stop_capture.is_set():
+            if not camera.grab():
+                time.sleep(0.1)
+                continue
+            
+            if self._frame_requested.is_set():
+                self._frame_requested.clear()
+                ret, frame = camera.retrieve()
+                self._put_latest_frame(frame if ret else None)
+    
+    def _put_latest_frame(self, frame):
+        """Place a frame in the hand-off queue, dropping any older frame"""
+        self._drain_frame_queue()
+        self._frame_queue.put_nowait(frame)
+    
+    def _drain_frame_queue(self):
+        """Remove any frame waiting in the hand-off queue"""
+        try:
+            self._frame_queue.get_nowait()
+        except queue.Empty:
+            pass
+    
+    def capture_frame(self, timeout=5):
         """
         Capture a frame from the initialized camera
         
+        Args:
+            timeout (float): Seconds to wait for the capture thread
+            
         Returns:
             numpy.ndarray: Captured frame or None if capture failed
         """
         if self.camera is None or not self.camera.isOpened():
             print("Camera not initialized")
             return None
+        
+        # A frame delivered after an earlier request timed out is stale;
+        # drop it so this call waits for a fresh one
+        self._drain_frame_queue()
+        
+        # Restart the capture thread if it stopped unexpectedly
+        if self.capture_thread is None or not self.capture_thread.is_alive():
+            print("Capture thread not running, restarting it")
+            self._start_capture_thread()
+        
+        self._frame_requested.set()
+        try:
+            frame = self._frame_queue.get(timeout=timeout)
+        except queue.Empty:
+            frame = None
             
-        ret, frame = self.camera.read()
-        if not ret:
+        if frame is None:
             print("Failed to capture frame")
             return None
             
         return frame
     
     def release_camera(self):
-        """Release the currently initialized camera"""
+        """Stop the capture thread and release the currently initialized camera"""
+        if self.capture_thread is not None:
+            self._stop_capture.set()
+            self.capture_thread.join(timeout=2)
+            self.capture_thread = None
+            
+        # Discard any frame left over from the previous camera
+        self._drain_frame_queue()
+            
         if self.camera is not None:
             self.camera.release()
             self.camera = None
\ No newline at end of file
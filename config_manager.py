@@ -1,20 +1,100 @@
 """
 Configuration Manager for Service Monitor
 """
+import functools
+import hashlib
 import json
+import os
+import string
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library parser
+    orjson = None
+
+# Buffer size for reading and writing the configuration file
+_IO_BUFFER_SIZE = 64 * 1024
+
+# Delay used to coalesce bursts of saves into one write
+_SAVE_DELAY_MS = 250
+
+# Characters kept when normalizing service names for matching
+_NAME_CHARS = frozenset(map(ord, string.ascii_lowercase + string.digits + '-'))
+
+
+class _StripTable(dict):
+    """Translation table that deletes every character not in _NAME_CHARS"""
+    def __missing__(self, key):
+        value = key if key in _NAME_CHARS else None
+        self[key] = value
+        return value
+
+
+_STRIP_TABLE = _StripTable()
+
+
+def normalize_service_name(service_name):
+    """
+    Normalize a service name for matching
+    
+    Lowercases the name and removes everything except letters, digits and
+    hyphens, so OCR noise such as stray punctuation does not break matching.
+    
+    Args:
+        service_name (str): Raw service name
+        
+    Returns:
+        str: Normalized service name
+    """
+    return service_name.lower().translate(_STRIP_TABLE)
+
+
+def _loads(data):
+    """Parse JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _digest(payload):
+    """Short fingerprint of serialized configuration bytes"""
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def _dumps(config):
+    """Serialize configuration to indented JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 class ConfigManager:
     """Manages configuration for the service monitoring system"""
-    def __init__(self):
+    def __init__(self, scheduler=None):
+        """
+        Initialize the configuration manager
+        
+        Args:
+            scheduler: Optional Tk widget used to debounce writes with after().
+                Without one, every save is written to disk immediately.
+        """
         self.config_file = Path('service_config.json')
+        self._scheduler = scheduler
+        self._dirty = False
+        self._flush_after_id = None
+        self._last_hash = None
+        self._config_mtime = None
+        
+        # Detected service names repeat every frame, so memoize their lookups
+        self._cached_lookup = functools.lru_cache(maxsize=256)(self._lookup_service_config)
         self.load_config()
 
     def load_config(self):
         """Load configuration from file or create default"""
         if self.config_file.exists():
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
+            with open(self.config_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                self.config = _loads(f.read())
         else:
             self.config = {
                 "default_config": {
@@ -24,12 +104,127 @@ class ConfigManager:
                 },
                 "services": {}
             }
-            self.save_config()
+            # Write the default file right away, even when writes are debounced
+            self._dirty = True
+            self._write_now()
+        
+        self._normalize_config()
+        self._rebuild_index()
+        self._csv_cache = {}
+        
+        # Remember what is on disk so unchanged saves can be skipped
+        self._last_hash = _digest(_dumps(self.config))
+        self._config_mtime = self.config_file.stat().st_mtime
+
+    def reload_if_changed(self):
+        """
+        Reload the configuration if the file changed since it was last read or written
+        
+        Returns:
+            bool: True if the configuration was reloaded
+        """
+        try:
+            mtime = self.config_file.stat().st_mtime
+        except FileNotFoundError:
+            return False
+            
+        if mtime == self._config_mtime:
+            return False
+            
+        self.load_config()
+        return True
 
     def save_config(self):
-        """Save configuration to file"""
-        with open(self.config_file, 'w') as f:
-            json.dump(self.config, f, indent=4)
+        """
+        Save configuration to file
+        
+        With a scheduler the write is deferred briefly so a burst of saves
+        results in a single write; call flush() to force it out.
+        """
+        # Services may have been added, renamed or removed since the last save
+        self._rebuild_index()
+        self._csv_cache = {}
+        
+        self._dirty = True
+        if self._scheduler is None:
+            self._write_now()
+        elif self._flush_after_id is None:
+            self._flush_after_id = self._scheduler.after(_SAVE_DELAY_MS, self._write_now)
+
+    def flush(self):
+        """Write any pending configuration changes to disk immediately"""
+        self._write_now()
+
+    def _write_now(self):
+        """Write the configuration to disk if it has unsaved changes"""
+        if self._flush_after_id is not None:
+            self._scheduler.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+            
+        if not self._dirty:
+            return
+        self._dirty = False
+            
+        # Skip the write entirely when nothing changed since the last one
+        payload = _dumps(self.config)
+        payload_hash = _digest(payload)
+        if payload_hash == self._last_hash:
+            return
+            
+        # Write to a temporary file and swap it in so readers never see a
+        # partially written configuration
+        tmp_file = self.config_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.config_file)
+        self._last_hash = payload_hash
+        self._config_mtime = self.config_file.stat().st_mtime
+
+    def _normalize_config(self):
+        """Fill in missing keys so every service has the full set of fields"""
+        default_config = self.config.setdefault('default_config', {})
+        for key in ('email', 'whatsapp', 'whatsapp_groups'):
+            default_config.setdefault(key, [])
+            
+        for service_config in self.config.setdefault('services', {}).values():
+            service_config.setdefault('email', [])
+            service_config.setdefault('whatsapp', [])
+            service_config.setdefault('whatsapp_groups', [])
+            service_config.setdefault('period', 0)
+            service_config.setdefault('number_of_alerts', 0)
+
+    def _rebuild_index(self):
+        """Map each normalized service name to its name in the configuration"""
+        self._lower_index = {
+            normalize_service_name(config_name): config_name
+            for config_name in self.config['services']
+        }
+        
+        # Cached lookups may point at services that changed
+        self._cached_lookup.cache_clear()
+
+    def get_service_csv(self, service_name):
+        """
+        Get the comma-separated recipient lists of a service for display
+        
+        Args:
+            service_name (str): Name of the service as stored in the configuration
+            
+        Returns:
+            tuple: (email_csv, whatsapp_csv, whatsapp_groups_csv)
+        """
+        csv_values = self._csv_cache.get(service_name)
+        if csv_values is None:
+            service_config = self.config['services'][service_name]
+            csv_values = (
+                ','.join(service_config['email']),
+                ','.join(service_config['whatsapp']),
+                ','.join(service_config['whatsapp_groups'])
+            )
+            self._csv_cache[service_name] = csv_values
+        return csv_values
 
     def get_service_config(self, service_name):
         """
@@ -41,13 +236,14 @@ class ConfigManager:
         Returns:
             dict: Configuration for the service or default if not found
         """
-        # Use the original service name for matching
-        lower_service_name = service_name.lower()
+        return self._cached_lookup(service_name)
 
-        # Try to find matching service configuration
-        for config_name in self.config['services']:
-            if lower_service_name == config_name.lower():
-                return self.config['services'][config_name]
+    def _lookup_service_config(self, service_name):
+        """Resolve a service name to its configuration without caching"""
+        # Look up the configured name for the normalized service name
+        config_name = self._lower_index.get(normalize_service_name(service_name))
+        if config_name is not None:
+            return self.config['services'][config_name]
         
         # Return default configuration if no match found
         return self.config['default_config']
\ No newline at end of file
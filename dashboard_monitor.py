@@ -2,6 +2,8 @@
 Main dashboard monitoring module that integrates all components
 """
 import os
+import queue
+import threading
 import time
 import tkinter as tk
 from datetime import datetime
@@ -10,10 +12,26 @@ from pathlib import Path
 from config_manager import ConfigManager
 from camera import CameraManager
 from image_processor import ImageProcessor
-from alerts import AlertManager
+from alerts import AlertManager, TIMESTAMP_FORMAT
 from dashboard_ui import DashboardUI
 from alert_config_ui import AlertConfigUI
 
+# Alerts queued within this many seconds of each other are sent together
+_ALERT_BATCH_WINDOW = 5
+
+# Maximum number of services collected into one alert batch
+_ALERT_BATCH_MAX = 20
+
+# Seconds allowed for sending one alert batch when the monitor shuts down
+_ALERT_SEND_TIMEOUT = 60
+
+# Seconds after which a frame is fully processed even if it looks unchanged
+_FULL_SCAN_INTERVAL = 600
+
+# Minutes between repeat alerts for a service that stays down, used when
+# the service configuration does not set an alert period
+_DEFAULT_ALERT_PERIOD = 15
+
 class DashboardMonitor:
     """Main class that integrates all components of the monitoring system"""
     
@@ -25,10 +43,29 @@ class DashboardMonitor:
         self.image_processor = ImageProcessor()
         self.alert_manager = AlertManager()
         
+        # Capture, OCR and alerting run as a pipeline: the monitor loop feeds
+        # frames to the OCR thread, which hands down services to the alert
+        # thread. A single alert thread keeps the shared SMTP session and the
+        # browser-driven WhatsApp sender from being used concurrently.
+        self._frame_queue = queue.Queue(maxsize=2)
+        self._alert_queue = queue.Queue()
+        self._ocr_thread = None
+        self._alert_thread = None
+        
         # Create logs directory if it doesn't exist
         self.logs_dir = Path('service_logs')
         self.logs_dir.mkdir(exist_ok=True)
         
+        # Results from the last fully processed frame, reused while the
+        # dashboard looks the same
+        self._last_signature = None
+        self._last_down = []
+        self._last_up = []
+        self._last_full_scan = 0.0
+        
+        # Per-service (time of last alert, alerts sent) for the current outage
+        self._alert_state = {}
+        
         # UI components are initialized in show_ui
         self.root = None
         self.ui = None
@@ -36,12 +73,16 @@ class DashboardMonitor:
     def show_ui(self):
         """Display the desktop UI for camera selection"""
         self.root = tk.Tk()
-        self.ui = DashboardUI(self.root, self.camera_manager, self.monitor)
+        self.ui = DashboardUI(self.root, self.camera_manager, self.monitor, self.image_processor)
         self.root.mainloop()
     
     def monitor(self):
         """Main monitoring loop"""
         try:
+            # Load OCR models before the first frame arrives
+            self.image_processor.warmup()
+            self._start_pipeline()
+            
             while True:
                 # Capture image from camera
                 image = self.camera_manager.capture_frame()
@@ -50,35 +91,8 @@ class DashboardMonitor:
                     time.sleep(5)
                     continue
                     
-                # Process the image
-                red_mask, green_mask, original_image = self.image_processor.process_image(image)
-                
-                # Extract service names from red and green regions
-                down_services = self.image_processor.extract_text(original_image, red_mask)
-                up_services = self.image_processor.extract_text(original_image, green_mask)
-                
-                # Handle each down service individually
-                print(f"Found {len(down_services)} down services and {len(up_services)} up services")
-                
-                for service in down_services:
-                    print(f"Service DOWN: {service}")
-                    # Get service configuration
-                    config = self.config_manager.get_service_config(service)
-                    
-                    # Send alerts
-                    self.alert_manager.send_email_alert(service, config)
-                    self.alert_manager.send_whatsapp_alert(service, config)
-                
-                # Log up services
-                for service in up_services:
-                    print(f"Service UP: {service}")
-                    self.alert_manager.log_service_status(
-                        service,
-                        "UP",
-                        False,
-                        None,
-                        None
-                    )
+                # Hand the frame to the OCR thread
+                self._put_frame(image)
                 
                 # Wait before next check
                 time.sleep(60)  # Check every minute
@@ -86,4 +100,225 @@ class DashboardMonitor:
         except KeyboardInterrupt:
             print("\nMonitoring stopped by user")
         finally:
-            self.camera_manager.release_camera()
\ No newline at end of file
+            ocr_stopped, alert_stopped = self._stop_pipeline()
+            # A thread still running may be inside the SMTP session or the
+            # Tesseract API; leave those to be released at process exit
+            if alert_stopped:
+                self.alert_manager.close()
+            else:
+                self.alert_manager.flush_log()
+            if ocr_stopped:
+                self.image_processor.close()
+            self.camera_manager.release_camera()
+    
+    def _start_pipeline(self):
+        """Start the OCR and alert threads"""
+        self._ocr_thread = threading.Thread(target=self._ocr_loop, name="ocr", daemon=True)
+        self._alert_thread = threading.Thread(target=self._alert_loop, name="alert", daemon=True)
+        self._ocr_thread.start()
+        self._alert_thread.start()
+    
+    def _stop_pipeline(self):
+        """
+        Signal the pipeline threads to finish and wait briefly for them
+        
+        Returns:
+            tuple: (ocr_stopped, alert_stopped), True for each thread that is
+            no longer running
+        """
+        if self._ocr_thread is None:
+            return True, True
+            
+        # A None frame tells the OCR thread to stop; it passes the signal on
+        # to the alert thread once its last frame is processed
+        self._put_frame(None)
+        self._ocr_thread.join(timeout=30)
+        ocr_stopped = not self._ocr_thread.is_alive()
+        if not ocr_stopped:
+            # Stop the alert thread directly so queued alerts still go out
+            self._alert_queue.put(None)
+            
+        # The alert thread may still be collecting a batch and then sending it
+        self._alert_thread.join(timeout=_ALERT_BATCH_WINDOW + _ALERT_SEND_TIMEOUT)
+        alert_stopped = not self._alert_thread.is_alive()
+        self._ocr_thread = None
+        self._alert_thread = None
+        return ocr_stopped, alert_stopped
+    
+    def _put_frame(self, frame):
+        """Queue a frame for OCR, dropping the oldest one if OCR is behind"""
+        while True:
+            try:
+                self._frame_queue.put_nowait(frame)
+                return
+            except queue.Full:
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _ocr_loop(self):
+        """Detect service statuses in queued frames and queue alerts for down services"""
+        while True:
+            image = self._frame_queue.get()
+            if image is None:
+                self._alert_queue.put(None)
+                return
+                
+            try:
+                self._process_frame(image)
+            except Exception as e:
+                print(f"Error processing frame: {str(e)}")
+    
+    def _process_frame(self, image):
+        """
+        Detect service statuses in one frame, log UP services and queue DOWN ones
+        
+        Args:
+            image: Captured camera frame
+        """
+        # Build the colour masks; they are cheap compared to OCR
+        red_mask, green_mask, original_image = self.image_processor.process_image(image)
+        
+        # Skip OCR entirely when no status light has changed, but rescan
+        # periodically so a bad read is not repeated forever
+        signature = self.image_processor.status_signature(red_mask, green_mask)
+        now = time.monotonic()
+        if (self.image_processor.status_unchanged(self._last_signature, signature)
+                and now - self._last_full_scan < _FULL_SCAN_INTERVAL):
+            print("Status lights unchanged, reusing previous results")
+            down_services, up_services = self._last_down, self._last_up
+        else:
+            # Extract service names from red and green regions in one pass
+            down_services, up_services = self.image_processor.extract_statuses(
+                original_image, red_mask, green_mask
+            )
+            
+            self._last_signature = signature
+            self._last_down, self._last_up = down_services, up_services
+            self._last_full_scan = now
+        
+        # Report detection results
+        print(f"Found {len(down_services)} down services and {len(up_services)} up services")
+        
+        # Look up each down service's configuration once
+        down_configs = [
+            (service, self.config_manager.get_service_config(service))
+            for service in down_services
+        ]
+        for service, _ in down_configs:
+            print(f"Service DOWN: {service}")
+        
+        # Only alert on new outages and on the configured repeat schedule
+        due_configs = [
+            (service, config) for service, config in down_configs
+            if self._alert_due(service, config, now)
+        ]
+        
+        # Hand alerts off to the alert thread
+        if due_configs:
+            self._alert_queue.put(due_configs)
+        
+        # Log up services with one timestamp for the whole frame; a
+        # recovered service starts a fresh outage next time
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        for service in up_services:
+            self._alert_state.pop(service, None)
+            print(f"Service UP: {service}")
+            self.alert_manager.log_service_status(
+                service,
+                "UP",
+                False,
+                None,
+                None,
+                timestamp
+            )
+            
+        # Write this frame's log rows together
+        self.alert_manager.flush_log()
+    
+    def _alert_due(self, service, config, now):
+        """
+        Decide whether a down service should be alerted on in this cycle
+        
+        The first detection of an outage always alerts. After that the
+        service is alerted again every 'period' minutes, up to
+        'number_of_alerts' alerts per outage (0 means no limit).
+        
+        Args:
+            service (str): Name of the down service
+            config (dict): Service configuration
+            now (float): Current time.monotonic() value
+            
+        Returns:
+            bool: True if an alert should be sent
+        """
+        state = self._alert_state.get(service)
+        if state is not None:
+            last_alert, alerts_sent = state
+            max_alerts = config.get('number_of_alerts', 0)
+            if max_alerts and alerts_sent >= max_alerts:
+                return False
+            period = config.get('period') or _DEFAULT_ALERT_PERIOD
+            if now - last_alert < period * 60:
+                return False
+            alerts_sent += 1
+        else:
+            alerts_sent = 1
+            
+        self._alert_state[service] = (now, alerts_sent)
+        return True
+    
+    def _alert_loop(self):
+        """Send queued alerts, combining alerts that arrive close together"""
+        while True:
+            batch = self._alert_queue.get()
+            if batch is None:
+                return
+                
+            # Collect whatever else arrives shortly after so it goes out in
+            # the same messages
+            stopping = False
+            deadline = time.monotonic() + _ALERT_BATCH_WINDOW
+            while len(batch) < _ALERT_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    more = self._alert_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if more is None:
+                    stopping = True
+                    break
+                batch = batch + more
+                
+            # A service reported by several frames is alerted once
+            self._send_alerts(list(dict(batch).items()))
+            if stopping:
+                return
+    
+    def _send_alerts(self, down_configs):
+        """
+        Send email and WhatsApp alerts for down services
+        
+        Args:
+            down_configs (list): List of (service_name, config) tuples
+        """
+        # Stamp the whole batch once instead of in every message and log row
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        try:
+            # Send email alerts, batching services that share recipients
+            if len(down_configs) > 1:
+                self.alert_manager.send_batch_email_alert(down_configs, timestamp)
+            else:
+                for service, config in down_configs:
+                    self.alert_manager.send_email_alert(service, config, timestamp)
+            
+            for service, config in down_configs:
+                self.alert_manager.send_whatsapp_alert(service, config, timestamp)
+        except Exception as e:
+            print(f"Error sending alerts: {str(e)}")
+        finally:
+            # Write this batch's log rows together
+            self.alert_manager.flush_log()
\ No newline at end of file
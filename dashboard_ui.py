@@ -5,15 +5,14 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 import cv2
-import re
 
 from alert_config_ui import AlertConfigUI
-from ui_utils import CreateToolTip
+from ui_utils import CreateToolTip, configure_styles_once
 
 class DashboardUI:
     """UI components for the main monitoring dashboard"""
     
-    def __init__(self, root, camera_manager, on_start_callback):
+    def __init__(self, root, camera_manager, on_start_callback, image_processor=None):
         """
         Initialize the dashboard UI
         
@@ -21,13 +20,16 @@ class DashboardUI:
             root: Tkinter root window
             camera_manager: CameraManager instance
             on_start_callback: Callback function when monitoring starts
+            image_processor: ImageProcessor to reuse for test images, created on first use if None
         """
         self.root = root
         self.camera_manager = camera_manager
         self.on_start_callback = on_start_callback
+        self.image_processor = image_processor
         self.camera_var = None
         self.service_display = None
         self.image_label = None
+        self._alert_ui = None  # Created on first use, then reused
         
         self._setup_root()
         self._create_menu()
@@ -41,25 +43,20 @@ class DashboardUI:
         self.root.configure(bg='#F0F0F0')
         
         # Set styles
-        style = ttk.Style()
-        style.theme_use('clam')  # Use clam theme as base
-        style.configure('TFrame', background='#F0F0F0')
-        style.configure('TButton', padding=6, relief="raised")
-        style.configure('TLabel', background='#F0F0F0', foreground='#000000')
-        style.configure('TLabelframe', background='#F0F0F0')
-        style.configure('TLabelframe.Label', background='#F0F0F0', foreground='#000000', font=('Segoe UI', 9, 'bold'))
-        style.configure('TSeparator', background='#C0C0C0')
-        style.configure('TNotebook', background='#F0F0F0')
-        style.configure('TNotebook.Tab', padding=[10, 4], font=('Segoe UI', 9), background='#E1E1E1')
-        style.configure('TEntry', fieldbackground='white', foreground='black')
-        style.configure('TCombobox', fieldbackground='white', foreground='black')
-        style.map('TNotebook.Tab', background=[('selected', '#F0F0F0'), ('active', '#E5E5E5')])
-        
-        # Make sure all child widgets inherit these styles
-        self.root.option_add("*TCombobox*Listbox*Background", 'white')
-        self.root.option_add("*TCombobox*Listbox*Foreground", 'black')
-        self.root.option_add("*Background", '#F0F0F0')
-        self.root.option_add("*Foreground", 'black')
+        configure_styles_once(self.root)
+        
+        # Save pending alert settings when the window is closed
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+    
+    def _flush_alert_config(self):
+        """Write alert settings still waiting on the debounced save"""
+        if self._alert_ui is not None:
+            self._alert_ui.config_manager.flush()
+    
+    def _on_close(self):
+        """Save pending alert settings and close the main window"""
+        self._flush_alert_config()
+        self.root.destroy()
     
     def _create_menu(self):
         """Create menu bar"""
@@ -71,12 +68,12 @@ class DashboardUI:
         menu_bar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Start Monitoring", command=self.start_monitoring)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         
         # Configuration menu
         config_menu = tk.Menu(menu_bar, tearoff=0)
         menu_bar.add_cascade(label="Configuration", menu=config_menu)
-        config_menu.add_command(label="Alert Settings", command=lambda: AlertConfigUI(self.root))
+        config_menu.add_command(label="Alert Settings", command=self.open_alert_config)
         
         # Help menu
         help_menu = tk.Menu(menu_bar, tearoff=0)
@@ -134,7 +131,7 @@ class DashboardUI:
         )
         
         redetect_btn = ttk.Button(camera_control_frame, text="Refresh", width=15,
-                                command=lambda: self.update_camera_list(camera_dropdown, start_btn))
+                                command=lambda: self.update_camera_list(camera_dropdown, start_btn, force=True))
         redetect_btn.pack(side=tk.RIGHT)
         
         # Separator
@@ -156,7 +153,7 @@ class DashboardUI:
         start_btn.pack(side=tk.RIGHT, padx=5)
         
         config_btn = ttk.Button(button_frame, text="Alert Configuration", width=20,
-                              command=lambda: AlertConfigUI(self.root))
+                              command=self.open_alert_config)
         config_btn.pack(side=tk.RIGHT, padx=5)
         
         process_image_button = ttk.Button(button_frame, text="Process Image", width=20,
@@ -184,15 +181,23 @@ class DashboardUI:
         # Center window
         self.center_window()
     
-    def update_camera_list(self, camera_dropdown, start_btn):
+    def open_alert_config(self):
+        """Show the alert configuration window, reusing it if it was opened before"""
+        if self._alert_ui is None or not self._alert_ui.window.winfo_exists():
+            self._alert_ui = AlertConfigUI(self.root)
+        else:
+            self._alert_ui.show()
+    
+    def update_camera_list(self, camera_dropdown, start_btn, force=False):
         """
         Update the camera dropdown list and monitoring button state
         
         Args:
             camera_dropdown: Combobox for camera selection
             start_btn: Start monitoring button
+            force (bool): Probe the cameras again instead of using the cached list
         """
-        available_cameras = self.camera_manager.list_cameras()
+        available_cameras = self.camera_manager.list_cameras(force=force)
         
         if not available_cameras:
             camera_dropdown['values'] = ['No cameras detected']
@@ -227,26 +232,29 @@ class DashboardUI:
             messagebox.showerror("Error", "No camera available for monitoring")
             return
             
-        # Initialize the selected camera
-        match = re.search(r'ID: (\d+)', selected_camera)
-        if not match:
+        # Initialize the selected camera; labels look like "Camera 0 (ID: 0)"
+        try:
+            camera_id = int(selected_camera.rpartition('ID: ')[2].rstrip(') '))
+        except ValueError:
             messagebox.showerror("Error", "Invalid camera selection")
             return
             
-        camera_id = int(match.group(1))
         if not self.camera_manager.initialize_camera(camera_id):
             messagebox.showerror("Error", f"Failed to initialize camera {camera_id}")
             return
             
-        # Call the callback function to start monitoring
+        # Save pending alert settings before the window and its timers go away,
+        # then call the callback function to start monitoring
+        self._flush_alert_config()
         self.root.destroy()
         self.on_start_callback()
     
     def process_image(self):
         """Process a test image instead of capturing from camera"""
-        from image_processor import ImageProcessor
-        
-        processor = ImageProcessor()
+        # Share one processor across clicks so the OCR engine is loaded once
+        if self.image_processor is None:
+            from image_processor import ImageProcessor
+            self.image_processor = ImageProcessor()
         
         # Load a test image
         test_image_path = 'img/test.jpeg'
@@ -260,7 +268,7 @@ class DashboardUI:
             return
             
         # Process the image
-        services, annotated_img = processor.detect_services(image)
+        services, annotated_img = self.image_processor.detect_services(image)
         
         # Display the annotated image
         annotated_img = cv2.cvtColor(annotated_img, cv2.COLOR_BGR2RGB)
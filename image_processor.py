@@ -1,23 +1,303 @@
 """
 Image processing utilities for service monitoring
 """
+import bisect
 import cv2
 import numpy as np
-import pytesseract
 from pathlib import Path
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Each Tesseract process would otherwise start an OpenMP pool sized to every
+# core; with several processes running side by side the pools thrash, so
+# keep Tesseract single-threaded and parallelize across processes instead.
+# Set before pytesseract spawns anything so every child inherits it.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+# HSV colour thresholds, built once and shared by all processors
+_RED_LOWER = np.array([0, 120, 70], dtype=np.uint8)
+_RED_UPPER = np.array([10, 255, 255], dtype=np.uint8)
+_GREEN_LOWER = np.array([35, 120, 70], dtype=np.uint8)
+_GREEN_UPPER = np.array([85, 255, 255], dtype=np.uint8)
+_ORANGE_LOWER = np.array([10, 100, 100], dtype=np.uint8)
+_ORANGE_UPPER = np.array([25, 255, 255], dtype=np.uint8)
+
+# Factor by which frames are shrunk before colour masking; indicators are
+# large blobs, so their boxes survive and are scaled back up for OCR
+_MASK_SCALE = 2
+
+# Grid, in image pixels, to which indicator boxes are rounded when
+# fingerprinting the status lights
+_SIGNATURE_GRID = 4
+
+# Frames at least this tall use the OpenCL path when it is enabled; smaller
+# frames do not repay the upload and download
+_OPENCL_MIN_HEIGHT = 1080
+
+# Tesseract options: LSTM engine only, labels read as a uniform text block
+_TESSERACT_CONFIG = '--oem 1 --psm 6'
+
+# Blank rows between regions stacked into one image for Tesseract
+_STACK_GAP = 20
+
+# Number of Tesseract processes run in parallel for one frame
+_OCR_WORKERS = os.cpu_count() or 1
+
+
+# pytesseract is imported on first OCR call so the UI can start without it
+_pytesseract = None
+
+
+def _get_pytesseract():
+    """Import pytesseract on first use and cache the module"""
+    global _pytesseract
+    if _pytesseract is None:
+        import pytesseract as _pytesseract
+    return _pytesseract
+
+
+def _large_component_boxes(stats, scale):
+    """
+    Select the boxes of components big enough to be status indicators
+    
+    Args:
+        stats: Stats array from cv2.connectedComponentsWithStats
+        scale (int): Size of one mask pixel in image pixels
+        
+    Returns:
+        numpy.ndarray: N x 4 array of (x, y, w, h) boxes in mask coordinates
+    """
+    stats = stats[1:]  # Label 0 is the background
+    large = stats[:, cv2.CC_STAT_AREA] * (scale * scale) > 100
+    return stats[large, :4]
+
+
+def _drop_contained_rects(rects):
+    """
+    Remove rectangles that repeat or lie inside another rectangle
+    
+    Partly overlapping rectangles are all kept, so labels on neighbouring
+    rows are still read separately.
+    
+    Args:
+        rects (list): List of (x1, y1, x2, y2) rectangles
+        
+    Returns:
+        list: Remaining rectangles in their original order
+    """
+    kept = []
+    for i, (x1, y1, x2, y2) in enumerate(rects):
+        inside = any(
+            ox1 <= x1 and oy1 <= y1 and x2 <= ox2 and y2 <= oy2
+            and ((ox1, oy1, ox2, oy2) != (x1, y1, x2, y2) or j < i)
+            for j, (ox1, oy1, ox2, oy2) in enumerate(rects) if j != i
+        )
+        if not inside:
+            kept.append((x1, y1, x2, y2))
+    return kept
+
+
+def _merge_row_boxes(boxes):
+    """
+    Merge indicator boxes that sit side by side on the same row
+    
+    Two boxes merge when their vertical extents overlap and their padded
+    label regions would touch horizontally; boxes on different rows never
+    merge, however close together they are.
+    
+    Args:
+        boxes (list): List of (x1, y1, x2, y2) unpadded indicator boxes
+        
+    Returns:
+        list: Merged (x1, y1, x2, y2) boxes in top-to-bottom order
+    """
+    merged = []
+    for x1, y1, x2, y2 in sorted(boxes, key=lambda b: (b[1], b[0])):
+        # Absorb every merged box the current one reaches; restart the scan
+        # whenever the union grows since it may now reach earlier ones
+        i = 0
+        while i < len(merged):
+            mx1, my1, mx2, my2 = merged[i]
+            if y1 < my2 and my1 < y2 and x1 - 200 < mx2 and mx1 < x2 + 200:
+                x1, y1 = min(x1, mx1), min(y1, my1)
+                x2, y2 = max(x2, mx2), max(y2, my2)
+                merged.pop(i)
+                i = 0
+            else:
+                i += 1
+        merged.append((x1, y1, x2, y2))
+    return sorted(merged, key=lambda b: (b[1], b[0]))
+
+
+def _label_rects(boxes, width, height):
+    """
+    Pad each indicator row to cover its label without reaching other rows
+    
+    The vertical padding stops halfway to any other row whose box lies in
+    the padded columns, so closely stacked lights do not read each other's
+    labels.
+    
+    Args:
+        boxes (list): List of (x1, y1, x2, y2) indicator row boxes
+        width, height (int): Image dimensions used for clamping
+        
+    Returns:
+        list: (x1, y1, x2, y2) padded region for each box
+    """
+    rects = []
+    for x1, y1, x2, y2 in boxes:
+        px1, py1, px2, py2 = _pad_rect(x1, y1, x2 - x1, y2 - y1, width, height)
+        for ox1, oy1, ox2, oy2 in boxes:
+            if ox2 <= px1 or px2 <= ox1:
+                continue
+            if oy2 <= y1:
+                py1 = max(py1, (oy2 + y1) // 2)
+            elif oy1 >= y2:
+                py2 = min(py2, (y2 + oy1) // 2)
+        rects.append((px1, py1, px2, py2))
+    return rects
+
+
+def _pad_rect(x, y, w, h, width, height):
+    """
+    Expand an indicator's bounding box to cover the label next to it
+    
+    Args:
+        x, y, w, h (int): Indicator bounding box
+        width, height (int): Image dimensions used for clamping
+        
+    Returns:
+        tuple: (x1, y1, x2, y2) padded region
+    """
+    return (max(0, x-100), max(0, y-20),
+            min(width, x+w+100), min(height, y+h+20))
+
+
+def _stack_rois(rois):
+    """
+    Stack grayscale regions into one tall image so Tesseract runs once
+    
+    Each region is padded on the right to the widest region and followed by
+    a blank strip, both filled with the region's median (background) value.
+    
+    Args:
+        rois (list): Grayscale images
+        
+    Returns:
+        tuple: (composite image, list of each region's starting row)
+    """
+    width = max(roi.shape[1] for roi in rois)
+    padded = []
+    starts = []
+    top = 0
+    for roi in rois:
+        fill = int(np.median(roi))
+        padded.append(cv2.copyMakeBorder(
+            roi, 0, _STACK_GAP, 0, width - roi.shape[1],
+            cv2.BORDER_CONSTANT, value=fill
+        ))
+        starts.append(top)
+        top += roi.shape[0] + _STACK_GAP
+    return cv2.vconcat(padded), starts
+
 
 class ImageProcessor:
     """Handles processing camera images to detect service status indicators"""
     
     def __init__(self):
         # Define color thresholds for red and green in HSV
-        self.red_lower = np.array([0, 120, 70])
-        self.red_upper = np.array([10, 255, 255])
-        self.green_lower = np.array([35, 120, 70])
-        self.green_upper = np.array([85, 255, 255])
-        self.orange_lower = np.array([10, 100, 100])
-        self.orange_upper = np.array([25, 255, 255])
+        self.red_lower = _RED_LOWER
+        self.red_upper = _RED_UPPER
+        self.green_lower = _GREEN_LOWER
+        self.green_upper = _GREEN_UPPER
+        self.orange_lower = _ORANGE_LOWER
+        self.orange_upper = _ORANGE_UPPER
+        
+        # Kernel for removing speckle noise from the colour masks
+        self.open_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+        
+        # Reusable per-frame buffers, allocated on the first frame
+        self._small = None
+        self._small_hsv = None
+        self._hsv = None
+        self._red_mask = None
+        self._green_mask = None
+        self._combined_mask = None
+        self._orange_mask = None
+        
+        # Optional OpenCL offload of the colour masking for large frames
+        self.use_opencl = (
+            os.getenv('USE_OPENCL', '').lower() in ('1', 'true', 'yes')
+            and cv2.ocl.haveOpenCL()
+        )
+        if self.use_opencl:
+            cv2.ocl.setUseOpenCL(True)
+        
+        # Optional EasyOCR reader for batched GPU recognition; otherwise an
+        # in-process Tesseract API is used when tesserocr is installed. Both
+        # are created on first OCR or in warmup() so the UI starts quickly.
+        self.reader = None
+        self.tess_api = None
+        self._ocr_loaded = False
+    
+    def _load_ocr_engine(self):
+        """Create the configured OCR engine the first time it is needed"""
+        if self._ocr_loaded:
+            return
+        self._ocr_loaded = True
+        if os.getenv('OCR_ENGINE', 'tesseract').lower() == 'easyocr':
+            self.reader = self._create_easyocr_reader()
+        if self.reader is None:
+            self.tess_api = self._create_tess_api()
+    
+    def _create_easyocr_reader(self):
+        """
+        Create an EasyOCR reader if the package is available
+        
+        Returns:
+            easyocr.Reader: Reader instance or None if EasyOCR is not installed
+        """
+        try:
+            import easyocr
+        except ImportError:
+            print("EasyOCR is not installed, falling back to Tesseract")
+            return None
+        return easyocr.Reader(['en'], gpu=True, cudnn_benchmark=True)
+    
+    def _create_tess_api(self):
+        """
+        Create a persistent Tesseract API if tesserocr is available
+        
+        The API keeps the language model loaded, unlike pytesseract which
+        starts a new tesseract process for every call.
+        
+        Returns:
+            tesserocr.PyTessBaseAPI: API instance or None if tesserocr is not installed
+        """
+        try:
+            from tesserocr import PyTessBaseAPI, OEM, PSM
+        except ImportError:
+            return None
+        return PyTessBaseAPI(psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY, lang='eng')
+    
+    def close(self):
+        """Release the persistent Tesseract API if one was created"""
+        if self.tess_api is not None:
+            self.tess_api.End()
+            self.tess_api = None
+        self._ocr_loaded = False
+    
+    def warmup(self, batch_size=4):
+        """
+        Load the OCR engine and run a dummy batch through it so the first
+        frame is not slowed down by model initialization and cuDNN autotuning
+        
+        Args:
+            batch_size (int): Number of blank ROIs in the warmup batch
+        """
+        self._load_ocr_engine()
+        if self.reader is not None:
+            self.reader.readtext_batched(np.zeros([batch_size, 64, 256, 3], dtype=np.uint8))
     
     def process_image(self, image):
         """
@@ -26,21 +306,45 @@ class ImageProcessor:
         Args:
             image: OpenCV image object
             
+        The masks are computed on a frame shrunk by _MASK_SCALE and are
+        buffers owned by the processor that the next call overwrites.
+        
         Returns:
-            tuple: (red_mask, green_mask)
+            tuple: (red_mask, green_mask, original_image)
         """
         if image is None:
             raise ValueError("Image cannot be None")
             
-        # Make a copy of the original image
-        original_image = image.copy()
+        # The frame is only read here and by the OCR step, so it is used
+        # directly instead of being copied
+        original_image = image
         
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(original_image, cv2.COLOR_BGR2HSV)
+        # Reuse the HSV and mask buffers from the previous frame
+        self._ensure_buffers(original_image.shape)
         
-        # Create masks for red and green
-        red_mask = cv2.inRange(hsv, self.red_lower, self.red_upper)
-        green_mask = cv2.inRange(hsv, self.green_lower, self.green_upper)
+        if self.use_opencl and original_image.shape[0] >= _OPENCL_MIN_HEIGHT:
+            red_mask, green_mask = self._status_masks_opencl(original_image)
+        else:
+            # Shrink the frame before colour work; area averaging keeps the
+            # indicator colours intact while cutting the pixel count by 4x
+            small = cv2.resize(
+                original_image, (self._small.shape[1], self._small.shape[0]),
+                dst=self._small, interpolation=cv2.INTER_AREA
+            )
+            
+            # Convert to HSV color space. The whole (shrunk) frame is
+            # converted on purpose: gating pixels on value/saturation first
+            # and converting only the survivors measured slower than
+            # OpenCV's vectorized pass
+            hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV, dst=self._small_hsv)
+            
+            # Create masks for red and green
+            red_mask = cv2.inRange(hsv, self.red_lower, self.red_upper, dst=self._red_mask)
+            green_mask = cv2.inRange(hsv, self.green_lower, self.green_upper, dst=self._green_mask)
+            
+            # Remove isolated noise pixels so contour extraction only sees real indicators
+            cv2.morphologyEx(red_mask, cv2.MORPH_OPEN, self.open_kernel, dst=red_mask)
+            cv2.morphologyEx(green_mask, cv2.MORPH_OPEN, self.open_kernel, dst=green_mask)
         
         # Save for debugging if needed
         output_path = Path("dashboard_screenshot.jpg")
@@ -48,6 +352,110 @@ class ImageProcessor:
         
         return red_mask, green_mask, original_image
     
+    def _status_masks_opencl(self, image):
+        """
+        Build the red and green masks on the OpenCL device
+        
+        Runs the same shrink, HSV conversion, thresholds and opening as the
+        CPU path on UMat operands, then downloads the two small masks into
+        the processor's buffers for component labelling.
+        
+        Args:
+            image: BGR frame
+            
+        Returns:
+            tuple: (red_mask, green_mask) written into the processor's buffers
+        """
+        size = (self._small.shape[1], self._small.shape[0])
+        small = cv2.resize(cv2.UMat(image), size, interpolation=cv2.INTER_AREA)
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        
+        masks = []
+        for lower, upper, buffer in ((self.red_lower, self.red_upper, self._red_mask),
+                                     (self.green_lower, self.green_upper, self._green_mask)):
+            mask = cv2.inRange(hsv, lower, upper)
+            mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self.open_kernel)
+            np.copyto(buffer, mask.get())
+            masks.append(buffer)
+        return tuple(masks)
+    
+    def _ensure_buffers(self, shape):
+        """
+        Allocate the HSV and mask buffers when the frame shape changes
+        
+        Args:
+            shape (tuple): Shape of the BGR frame
+        """
+        if self._hsv is None or self._hsv.shape != shape:
+            self._hsv = np.empty(shape, dtype=np.uint8)
+            self._orange_mask = np.empty(shape[:2], dtype=np.uint8)
+            
+            # Status masks work on the shrunk frame
+            small_shape = (shape[0] // _MASK_SCALE, shape[1] // _MASK_SCALE) + tuple(shape[2:])
+            self._small = np.empty(small_shape, dtype=np.uint8)
+            self._small_hsv = np.empty_like(self._small)
+            self._red_mask = np.empty(small_shape[:2], dtype=np.uint8)
+            self._green_mask = np.empty_like(self._red_mask)
+            self._combined_mask = np.empty_like(self._red_mask)
+    
+    def status_signature(self, red_mask, green_mask):
+        """
+        Compute a cheap fingerprint of the status lights to detect an unchanged dashboard
+        
+        The fingerprint lists the indicator boxes of each colour, rounded to
+        _SIGNATURE_GRID pixels, so a light that appears, disappears or changes
+        colour changes it while sensor noise along a light's edge does not.
+        Compare fingerprints with status_unchanged().
+        
+        Args:
+            red_mask: Binary mask of red (down) indicators
+            green_mask: Binary mask of green (up) indicators
+            
+        Returns:
+            tuple: (red boxes, green boxes), each a sorted tuple of rounded
+            (center x, center y, width, height) in full-image grid units
+        """
+        signature = []
+        for mask in (red_mask, green_mask):
+            _, _, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+            boxes = _large_component_boxes(stats, _MASK_SCALE) * _MASK_SCALE
+            
+            # Round centres and sizes in full-image pixels to the grid
+            centers = boxes[:, :2] + boxes[:, 2:] / 2
+            rounded = np.rint(np.hstack((centers, boxes[:, 2:])) / _SIGNATURE_GRID).astype(int)
+            signature.append(tuple(sorted(map(tuple, rounded.tolist()))))
+        return tuple(signature)
+    
+    def status_unchanged(self, previous, current):
+        """
+        Check whether two status fingerprints describe the same lights
+        
+        Each light must have a counterpart of the same colour within one grid
+        step, which absorbs a value that rounds either way between frames.
+        
+        Args:
+            previous: Fingerprint from status_signature, or None
+            current: Fingerprint from status_signature
+            
+        Returns:
+            bool: True if the status lights are unchanged
+        """
+        if previous is None:
+            return False
+            
+        for old_boxes, new_boxes in zip(previous, current):
+            if len(old_boxes) != len(new_boxes):
+                return False
+            unmatched = list(new_boxes)
+            for old in old_boxes:
+                for i, new in enumerate(unmatched):
+                    if all(abs(a - b) <= 1 for a, b in zip(old, new)):
+                        del unmatched[i]
+                        break
+                else:
+                    return False
+        return True
+    
     def detect_services(self, image):
         """
         Detect service circles and extract service names
@@ -58,20 +466,22 @@ class ImageProcessor:
         Returns:
             list: List of detected service names
         """
-        # Make a copy of the original image
-        original_image = image.copy()
+        # Annotations are drawn on their own copy below, so the input frame
+        # itself does not need copying
+        original_image = image
         
-        # Convert to HSV color space
-        hsv = cv2.cvtColor(original_image, cv2.COLOR_BGR2HSV)
+        # Convert to HSV color space, reusing the per-frame buffers
+        self._ensure_buffers(original_image.shape)
+        hsv = cv2.cvtColor(original_image, cv2.COLOR_BGR2HSV, dst=self._hsv)
         
         # Create mask for orange (service circles)
-        mask_orange = cv2.inRange(hsv, self.orange_lower, self.orange_upper)
+        mask_orange = cv2.inRange(hsv, self.orange_lower, self.orange_upper, dst=self._orange_mask)
         
         # Find contours
         contours, _ = cv2.findContours(mask_orange, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
-        # Process each contour
-        detected_services = []
+        # Collect the label region under each circle
+        rects = []
         annotated_img = original_image.copy()
         
         for cnt in contours:
@@ -102,64 +512,186 @@ class ImageProcessor:
 
                 # Draw the expanded rectangle
                 cv2.rectangle(annotated_img, (x1, y1), (x2, y2), (255, 0, 0), thickness=3)
-
-                # Extract and process the ROI
-                cropped_image = original_image[y1:y2, x1:x2]
-                
-                # Save cropped image for debugging
-                cv2.imwrite('cropped_roi.jpeg', cropped_image)
+                rects.append((x1, y1, x2, y2))
                 
-                # Convert to grayscale for OCR
-                gray_cropped_image = cv2.cvtColor(cropped_image, cv2.COLOR_BGR2GRAY)
-
-                # Apply Otsu's thresholding
-                _, thresh_image = cv2.threshold(gray_cropped_image, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-                # OCR to extract text
-                custom_config = r'--oem 3 --psm 6'
-                extracted_text = pytesseract.image_to_string(
-                    thresh_image, config=custom_config
-                ).strip()
-
-                # Clean up text
-                if '\n' in extracted_text:
-                    extracted_text = ' '.join(extracted_text.splitlines())
-
-                service_name = extracted_text.strip() if extracted_text else ''
-                if service_name:
-                    detected_services.append(service_name)
+        # Each circle's label is read on its own; only regions repeated by a
+        # duplicate contour are dropped, and all of them go through the
+        # batched OCR path together
+        detected_services = [
+            text for text in self._ocr_regions(original_image, _drop_contained_rects(rects)) if text
+        ]
 
         # Save annotated image
         cv2.imwrite('annotated_img.jpeg', annotated_img)
         
         return detected_services, annotated_img
 
-    def extract_text(self, image, mask):
+    def extract_statuses(self, image, red_mask, green_mask):
         """
-        Extract text near colored regions using OCR
+        Extract down and up service names in a single pass over both masks
+        
+        Each indicator is found once in the combined mask and tagged as down
+        if it contains any red pixels. Lights of one colour on the same row
+        are read together; every other light is read on its own.
         
         Args:
             image: OpenCV image object
-            mask: Binary mask of regions of interest
+            red_mask: Binary mask of red (down) indicators, full or reduced resolution
+            green_mask: Binary mask of green (up) indicators, same size as red_mask
             
         Returns:
-            list: List of extracted service names
+            tuple: (down_services, up_services)
+        """
+        # Reuse the combined-mask buffer when the masks match the current frame size
+        combined = self._combined_mask
+        if combined is None or combined.shape != red_mask.shape:
+            combined = None
+        combined = cv2.bitwise_or(red_mask, green_mask, dst=combined)
+        _, _, stats, _ = cv2.connectedComponentsWithStats(combined, connectivity=8)
+        height, width = image.shape[:2]
+        scale = height // combined.shape[0]
+        
+        # Tag each indicator with its colour; the colour check uses mask
+        # coordinates, the boxes full ones
+        red_boxes = []
+        green_boxes = []
+        for x, y, w, h in _large_component_boxes(stats, scale).tolist():
+            box = (x*scale, y*scale, (x+w)*scale, (y+h)*scale)
+            if cv2.countNonZero(red_mask[y:y+h, x:x+w]) > 0:
+                red_boxes.append(box)
+            else:
+                green_boxes.append(box)
+        
+        # Only lights of the same colour on the same row share a region, so
+        # a red light never pulls a green light's label into the down list
+        red_boxes = _merge_row_boxes(red_boxes)
+        green_boxes = _merge_row_boxes(green_boxes)
+        rects = _label_rects(red_boxes + green_boxes, width, height)
+        texts = self._ocr_regions(image, rects)
+        
+        down_services = [text for text in texts[:len(red_boxes)] if text]
+        up_services = [text for text in texts[len(red_boxes):] if text]
+        
+        # Drop duplicate names while keeping detection order
+        return list(dict.fromkeys(down_services)), list(dict.fromkeys(up_services))
+    
+    def _ocr_regions(self, image, rects):
         """
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        services = []
+        Read the text in each region of the image
         
-        for contour in contours:
-            if cv2.contourArea(contour) > 100:
-                x, y, w, h = cv2.boundingRect(contour)
-                roi = image[max(0, y-20):min(image.shape[0], y+h+20),
-                          max(0, x-100):min(image.shape[1], x+w+100)]
+        Args:
+            image: OpenCV image object
+            rects (list): List of (x1, y1, x2, y2) regions
+            
+        Returns:
+            list: Extracted text for each region, empty for empty regions
+        """
+        gray_rois = []
+        indices = []
+        for i, (x1, y1, x2, y2) in enumerate(rects):
+            roi = image[y1:y2, x1:x2]
+            
+            if roi.size == 0:  # Skip empty ROIs
+                continue
                 
-                if roi.size == 0:  # Skip empty ROIs
-                    continue
-                    
-                gray_roi = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
-                text = pytesseract.image_to_string(gray_roi).strip()
-                if text:
-                    services.append(text)
-                    
-        return services
\ No newline at end of file
+            gray_rois.append(cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY))
+            indices.append(i)
+        
+        texts = [''] * len(rects)
+        for i, text in zip(indices, self._read_texts(gray_rois)):
+            texts[i] = text
+        return texts
+    
+    def _read_texts(self, rois):
+        """
+        Run OCR on a list of regions
+        
+        Whitespace is normalized here for every backend so a multi-line label
+        reads the same whichever path recognized it; the text is used as the
+        service key in alert state and logs.
+        
+        Args:
+            rois (list): Grayscale images to read
+            
+        Returns:
+            list: Extracted text for each region, in the same order
+        """
+        if not rois:
+            return []
+        return [' '.join(text.split()) for text in self._recognize_texts(rois)]
+    
+    def _recognize_texts(self, rois):
+        """
+        Run the configured OCR backend on a non-empty list of regions
+        
+        Args:
+            rois (list): Grayscale images to read
+            
+        Returns:
+            list: Raw text for each region, in the same order
+        """
+        self._load_ocr_engine()
+        if self.reader is not None:
+            # Recognize every region in a single batched forward pass
+            results = self.reader.readtext_batched(
+                rois, n_width=256, n_height=64, detail=0, batch_size=len(rois)
+            )
+            return [' '.join(words).strip() for words in results]
+            
+        # Tesseract reads clean black-and-white input faster than raw
+        # grayscale, so binarize each region with Otsu's threshold first
+        rois = [
+            cv2.threshold(roi, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
+            for roi in rois
+        ]
+            
+        if self.tess_api is not None:
+            # The model is already loaded in-process, so read the regions
+            # directly; the API is not thread-safe, so one at a time
+            texts = []
+            for roi in rois:
+                height, width = roi.shape[:2]
+                self.tess_api.SetImageBytes(roi.tobytes(), width, height, 1, width)
+                texts.append(self.tess_api.GetUTF8Text().strip())
+            return texts
+            
+        # Split the regions into one contiguous chunk per worker and read the
+        # chunks in parallel Tesseract processes
+        chunk_count = min(len(rois), _OCR_WORKERS)
+        size = -(-len(rois) // chunk_count)
+        chunks = [rois[i:i + size] for i in range(0, len(rois), size)]
+        if len(chunks) == 1:
+            return self._read_texts_tesseract(chunks[0])
+            
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            results = executor.map(self._read_texts_tesseract, chunks)
+            return [text for chunk_texts in results for text in chunk_texts]
+    
+    def _read_texts_tesseract(self, rois):
+        """
+        Read a list of regions with a single Tesseract process
+        
+        Args:
+            rois (list): Grayscale images to read
+            
+        Returns:
+            list: Extracted text for each region, in the same order
+        """
+        pytesseract = _get_pytesseract()
+        if len(rois) == 1:
+            return [pytesseract.image_to_string(rois[0], config=_TESSERACT_CONFIG).strip()]
+            
+        # Every Tesseract call starts a new process and reloads the language
+        # model, so read all regions from one stacked image and assign each
+        # word back to the region its centre falls in
+        composite, starts = _stack_rois(rois)
+        data = pytesseract.image_to_data(
+            composite, config=_TESSERACT_CONFIG, output_type=pytesseract.Output.DICT
+        )
+        words = [[] for _ in rois]
+        for text, top, height in zip(data['text'], data['top'], data['height']):
+            text = text.strip()
+            if text:
+                index = bisect.bisect_right(starts, top + height // 2) - 1
+                words[index].append(text)
+        return [' '.join(region_words) for region_words in words]
\ No newline at end of file
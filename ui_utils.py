@@ -4,12 +4,62 @@ UI Utilities for Service Monitor
 import tkinter as tk
 from tkinter import ttk
 
+# ttk styles and the option database are shared by every window of the
+# application, so they only need to be configured once
+_STYLES_CONFIGURED = False
+
+def configure_styles_once(root):
+    """
+    Apply the shared ttk theme and widget styles the first time it is called
+    
+    Args:
+        root (tk.Misc): Any widget of the application, used to reach its Tk interpreter
+    """
+    global _STYLES_CONFIGURED
+    if _STYLES_CONFIGURED:
+        return
+    _STYLES_CONFIGURED = True
+    
+    style = ttk.Style(root)
+    style.theme_use('clam')  # Use clam theme as base
+    style.configure('TFrame', background='#F0F0F0')
+    style.configure('TButton', padding=6, relief="raised")
+    style.configure('TLabel', background='#F0F0F0', foreground='#000000')
+    style.configure('TLabelframe', background='#F0F0F0')
+    style.configure('TLabelframe.Label', background='#F0F0F0', foreground='#000000', font=('Segoe UI', 9, 'bold'))
+    style.configure('TSeparator', background='#C0C0C0')
+    style.configure('TNotebook', background='#F0F0F0')
+    style.configure('TNotebook.Tab', padding=[10, 4], font=('Segoe UI', 9), background='#E1E1E1')
+    style.configure('TEntry', fieldbackground='white', foreground='black')
+    style.configure('TCombobox', fieldbackground='white', foreground='black')
+    style.map('TNotebook.Tab', background=[('selected', '#F0F0F0'), ('active', '#E5E5E5')])
+    
+    # Make sure all child widgets inherit these styles
+    root.option_add("*TCombobox*Listbox*Background", 'white')
+    root.option_add("*TCombobox*Listbox*Foreground", 'black')
+    root.option_add("*Background", '#F0F0F0')
+    root.option_add("*Foreground", 'black')
+
 class CreateToolTip:
     """Create a tooltip for a given widget"""
     def __init__(self, widget, text):
         self.widget = widget
         self.text = text
-        self.tooltip = None
+        
+        # Build the tooltip window once; hovering only moves and shows it
+        self.tooltip = tk.Toplevel(self.widget)
+        self.tooltip.wm_overrideredirect(True)
+        self.tooltip.withdraw()
+        
+        # Create tooltip content
+        frame = ttk.Frame(self.tooltip, borderwidth=1, relief="solid")
+        frame.pack(fill="both", expand=True)
+        
+        self._label = ttk.Label(frame, text=self.text, wraplength=250, 
+                                background="#FFFFDD", foreground="black", 
+                                padding=(5, 3))
+        self._label.pack()
+        
         self.widget.bind("<Enter>", self.on_enter)
         self.widget.bind("<Leave>", self.on_leave)
     
@@ -19,22 +69,10 @@ class CreateToolTip:
         x += self.widget.winfo_rootx() + 25
         y += self.widget.winfo_rooty() + 25
         
-        # Create tooltip window
-        self.tooltip = tk.Toplevel(self.widget)
-        self.tooltip.wm_overrideredirect(True)
         self.tooltip.wm_geometry(f"+{x}+{y}")
-        
-        # Create tooltip content
-        frame = ttk.Frame(self.tooltip, borderwidth=1, relief="solid")
-        frame.pack(fill="both", expand=True)
-        
-        label = ttk.Label(frame, text=self.text, wraplength=250, 
-                        background="#FFFFDD", foreground="black", 
-                        padding=(5, 3))
-        label.pack()
+        self._label.configure(text=self.text)
+        self.tooltip.deiconify()
     
     def on_leave(self, event=None):
         """Hide tooltip when mouse leaves widget"""
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
\ No newline at end of file
+        self.tooltip.withdraw()
\ No newline at end of file
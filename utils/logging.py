@@ -17,6 +17,11 @@ class ServiceLogger:
         """
         self.logs_dir = Path(log_dir)
         self.logs_dir.mkdir(exist_ok=True)
+        
+        # Today's log stays open between events and is swapped when the date changes
+        self._csv_fh = None
+        self._csv_writer = None
+        self._csv_date = None
     
     def get_log_filename(self):
         """
@@ -57,20 +62,43 @@ class ServiceLogger:
             alert_type (str): Type of alert sent
             recipients (list): List of alert recipients
         """
-        csv_file = self.get_log_filename()
-        self.ensure_log_headers(csv_file)
+        now = datetime.now()
+        if now.date() != self._csv_date:
+            self._open_log(now)
 
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
         
-        with open(csv_file, 'a', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                timestamp,
-                service_name,
-                status,
-                alert_sent,
-                alert_type or '',
-                ', '.join(recipients) if recipients else ''
-            ])
+        self._csv_writer.writerow([
+            timestamp,
+            service_name,
+            status,
+            alert_sent,
+            alert_type or '',
+            ', '.join(recipients) if recipients else ''
+        ])
             
-        print(f"Logged {status} status for {service_name}")
\ No newline at end of file
+        print(f"Logged {status} status for {service_name}")
+    
+    def _open_log(self, now):
+        """
+        Close the current log and open the one for the given date
+        
+        Args:
+            now (datetime): Current time, used to pick the log file
+        """
+        self.close()
+        csv_file = self.get_log_filename()
+        self.ensure_log_headers(csv_file)
+        
+        # Line buffered so each row reaches the file as soon as it is logged
+        self._csv_fh = open(csv_file, 'a', newline='', buffering=1)
+        self._csv_writer = csv.writer(self._csv_fh)
+        self._csv_date = now.date()
+    
+    def close(self):
+        """Close the open log file, if any"""
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+            self._csv_date = None
\ No newline at end of file